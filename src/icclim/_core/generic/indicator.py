@@ -30,6 +30,7 @@ from icclim._core.constants import (
 )
 from icclim._core.generic.generic_templates import INDICATORS_TEMPLATES_EN
 from icclim._core.model.indicator import Indicator
+from icclim._core.utils import get_jinja_template
 from icclim.exception import InvalidIcclimArgumentError
 
 if TYPE_CHECKING:
@@ -291,9 +292,7 @@ class GenericIndicator(Indicator):
         if self.missing != "skip" and indexer is not None:
             # reference variable is a subset of the studied variable,
             # so no need to check it.
-            das = filter(lambda cv: not cv.is_reference, climate_vars)
-            das = (cv.studied_data for cv in das)
-            das = list(das)
+            das = [cv.studied_data for cv in climate_vars if not cv.is_reference]
             if "time" in result.dims:
                 result = self._handle_missing_values(
                     resample_freq=output_freq,
@@ -430,11 +429,8 @@ class GenericIndicator(Indicator):
 
     def _format_template(self, jinja_scope: dict) -> None:
         for templated_property in self.templated_properties:
-            template = jinja_env.from_string(
-                getattr(self, templated_property),
-                globals=jinja_scope,
-            )
-            setattr(self, templated_property, template.render())
+            template = get_jinja_template(jinja_env, getattr(self, templated_property))
+            setattr(self, templated_property, template.render(jinja_scope))
 
     def _handle_missing_values(
         self,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING, Any, Callable
 
 import numpy as np
@@ -24,7 +25,7 @@ from icclim._core.model.threshold import (
     Threshold,
     ThresholdValueType,
 )
-from icclim._core.utils import is_number_sequence
+from icclim._core.utils import get_jinja_template, is_number_sequence
 from icclim.exception import InvalidIcclimArgumentError
 
 if TYPE_CHECKING:
@@ -64,6 +65,18 @@ class BasicThreshold(Threshold):
     The actual unit can be overridden by modifying `value.attrs["units"]` directly.
     """
 
+    __slots__ = (
+        "_unit",
+        "initial_query",
+        "is_ready",
+        "offset",
+        "operator",
+        "prepare",
+        "threshold_min_value",
+        "threshold_var_name",
+        "value",
+    )
+
     @property
     def unit(self) -> str | None:
         """The unit of the threshold value(s)."""
@@ -87,7 +100,8 @@ class BasicThreshold(Threshold):
         registry.
         """
         if self.value is not None:
-            if self.value.attrs.get(UNITS_KEY, None) is not None and unit is not None:
+            current_unit = self.value.attrs.get(UNITS_KEY, None)
+            if current_unit is not None and unit is not None and current_unit != unit:
                 self.value = convert_units_to(self.value, unit, context="hydro")
             self.value.attrs[UNITS_KEY] = unit
         else:
@@ -136,6 +150,9 @@ class BasicThreshold(Threshold):
             If the threshold value type is not supported.
 
         """
+        # Slots have no class level default, unlike the `Threshold` attributes.
+        self.prepare = None
+        self._unit = None
         if (
             is_number_sequence(value) or isinstance(value, (float, int))
         ) and threshold_min_value is not None:
@@ -150,20 +167,10 @@ class BasicThreshold(Threshold):
             self.value = self._prepare_da(value, threshold_min_value, offset, unit)
             unit = self.value.attrs.get(UNITS_KEY, None)
         elif is_number_sequence(value):
-            self.value = DataArray(
-                name="threshold",
-                data=value,
-                attrs={UNITS_KEY: unit},
-                dims="threshold",
-                coords={"threshold": value},
-            )
-        elif isinstance(value, (float, int)):
             # e.g. build_threshold(">", [2,3,4], "degC") noqa: ERA001
-            self.value = DataArray(
-                name="threshold",
-                data=value,
-                attrs={UNITS_KEY: unit},
-            )
+            self.value = _get_scalar_threshold_da(tuple(value), unit)
+        elif isinstance(value, (float, int)):
+            self.value = _get_scalar_threshold_da(value, unit)
         elif value is None:
             self.prepare = self._partial_prepare_da(threshold_min_value, offset, unit)
             self.is_ready = False
@@ -243,7 +250,7 @@ class BasicThreshold(Threshold):
         }
         conf.update(jinja_scope)
         return {
-            k: jinja_env.from_string(v, globals=conf).render()
+            k: get_jinja_template(jinja_env, v).render(conf)
             for k, v in templates.items()
         }
 
@@ -311,7 +318,7 @@ class BasicThreshold(Threshold):
     ) -> xr.DataArray:
         built_value = _apply_min_value(value, min_value)
         built_value = _apply_offset(built_value, offset)
-        if unit is not None:
+        if unit is not None and built_value.attrs.get(UNITS_KEY, None) != unit:
             built_value = convert_units_to(built_value, unit, context="hydro")
         self.is_ready = True
         return built_value
@@ -338,3 +345,43 @@ def _apply_min_value(da: DataArray, min_value: pint.Quantity | None) -> xr.DataA
             min_value = convert_units_to(str(min_value), da, context="hydro")
         return da.where(da > min_value, np.nan)
     return da
+
+
+def _get_scalar_threshold_da(
+    value: float | tuple[float, ...],
+    unit: str | None,
+) -> DataArray:
+    """
+    Get the DataArray of a scalar or a sequence of scalar thresholds.
+
+    The same few thresholds (e.g. 0 degC, 1 mm/day) are built for many indices, so
+    the DataArray are cached. A deep copy, cheap for such small arrays, is returned
+    to keep the cache safe from any in place modification of `threshold.value`.
+    """
+    # The types are part of the key, otherwise 1 and 1.0 would share the same entry.
+    if isinstance(value, tuple):
+        value_types = tuple(type(v) for v in value)
+    else:
+        value_types = (type(value),)
+    return _build_scalar_threshold_da(value, value_types, unit).copy(deep=True)
+
+
+@functools.lru_cache(maxsize=256)
+def _build_scalar_threshold_da(
+    value: float | tuple[float, ...],
+    value_types: tuple[type, ...],  # noqa: ARG001 used as cache key
+    unit: str | None,
+) -> DataArray:
+    if isinstance(value, tuple):
+        return DataArray(
+            name="threshold",
+            data=list(value),
+            attrs={UNITS_KEY: unit},
+            dims="threshold",
+            coords={"threshold": list(value)},
+        )
+    return DataArray(
+        name="threshold",
+        data=value,
+        attrs={UNITS_KEY: unit},
+    )
@@ -17,6 +17,7 @@ from icclim._core.model.threshold import (
     Threshold,
     ThresholdBuilderInput,
 )
+from icclim._core.utils import get_jinja_template
 from icclim.exception import InvalidIcclimArgumentError
 
 if TYPE_CHECKING:
@@ -36,6 +37,8 @@ class BoundedThreshold(Threshold):
     The logical link must be either "and" or "or".
     """
 
+    __slots__ = ("initial_query", "left_threshold", "logical_link", "right_threshold")
+
     left_threshold: Threshold
     right_threshold: Threshold
     logical_link: LogicalLink
@@ -51,8 +54,9 @@ class BoundedThreshold(Threshold):
             The unit of the threshold if both thresholds have the same unit,
             otherwise None.
         """
-        if self.left_threshold.unit == self.right_threshold.unit:
-            return self.left_threshold.unit
+        left_unit = self.left_threshold.unit
+        if left_unit == self.right_threshold.unit:
+            return left_unit
         return None
 
     @unit.setter
@@ -184,7 +188,7 @@ class BoundedThreshold(Threshold):
         }
         conf.update(jinja_scope)
         return {
-            k: jinja_env.from_string(v, globals=conf).render()
+            k: get_jinja_template(jinja_env, v).render(conf)
             for k, v in templates.items()
         }
 
@@ -49,6 +49,7 @@ if TYPE_CHECKING:
 from typing import TYPE_CHECKING
 
 from icclim._core.model.threshold import Threshold, ThresholdValueType
+from icclim._core.utils import get_jinja_template
 
 
 class PercentileThreshold(Threshold):
@@ -98,13 +99,14 @@ class PercentileThreshold(Threshold):
     @unit.setter
     def unit(self, unit: str | xr.DataArray | pint.Quantity | pint.Unit) -> None:
         if self.is_ready:
-            if self.value.attrs.get(UNITS_KEY, None) is not None and unit is not None:
+            current_unit = self._prepared_value.attrs.get(UNITS_KEY, None)
+            if current_unit is not None and unit is not None and current_unit != unit:
                 self._prepared_value = convert_units_to(
                     self._prepared_value,
                     unit,
                     context="hydro",
                 )
-            self.value.attrs[UNITS_KEY] = unit
+            self._prepared_value.attrs[UNITS_KEY] = unit
 
     @property
     def value(self) -> PercentileDataArray:
@@ -290,7 +292,7 @@ class PercentileThreshold(Threshold):
         }
         conf.update(jinja_scope)
         return {
-            k: jinja_env.from_string(v, globals=conf).render()
+            k: get_jinja_template(jinja_env, v).render(conf)
             for k, v in templates.items()
         }
 
@@ -455,7 +457,8 @@ def _build_per_thresh_from_dataset(
         read_clim_bounds(reference_period, thresh_da),
     )
     if unit is not None:
-        if built_value.attrs.get(UNITS_KEY, None) is not None:
+        current_unit = built_value.attrs.get(UNITS_KEY, None)
+        if current_unit is not None and current_unit != unit:
             built_value = convert_units_to(built_value, unit, context="hydro")
         built_value.attrs[UNITS_KEY] = unit
     return built_value, DOY_COORDINATE in built_value.coords
@@ -460,9 +460,8 @@ def guess_standard_variable(data: DataArray) -> StandardVariable | None:
     """
     std_var = StandardVariableRegistry.lookup_no_error(str(data.name))
     if std_var is None and data.attrs.get("standard_name", None) is not None:
-        std_var = StandardVariableRegistry.lookup(
+        std_var = StandardVariableRegistry.lookup_no_error(
             data.attrs.get("standard_name"),
-            no_error=True,
         )
     if std_var is None:
         return None
@@ -784,12 +783,16 @@ def _guess_dataset_var_names(
             if len(standard_index.input_variables) != 1:
                 raise InvalidIcclimArgumentError(error_msg)
             return [get_name_of_first_var(ds)]
+        # upper-cased name -> actual name, the first variable wins on duplicates
+        ds_var_names: dict[str, str] = {}
+        for ds_var in ds.data_vars:
+            ds_var_names.setdefault(str(ds_var).upper(), str(ds_var))
         climate_var_names = []
         for expected_standard_var in standard_index.input_variables:
             for alias in expected_standard_var.aliases:
                 # check if dataset contains this alias
-                if _is_alias_valid(ds, alias):
-                    climate_var_names.append(_get_actual_name(ds, alias))
+                if (actual_name := ds_var_names.get(alias.upper())) is not None:
+                    climate_var_names.append(actual_name)
                     break
         if len(climate_var_names) < len(standard_index.input_variables):
             raise InvalidIcclimArgumentError(error_msg)
@@ -821,18 +824,6 @@ def _check_time_range_post_validity(
         raise InvalidIcclimArgumentError(msg)
 
 
-def _is_alias_valid(ds: Dataset, alias: str) -> bool:
-    return any(str(ds_var).upper() == alias.upper() for ds_var in ds.data_vars)
-
-
-def _get_actual_name(ds: Dataset, alias: str) -> str:
-    for ds_var in ds.data_vars:
-        if str(ds_var).upper() == alias.upper():
-            return str(ds_var)
-    msg = f"Could not find {alias} in dataset."
-    raise KeyError(msg)
-
-
 def _reduce_only_leap_years(da: DataArray) -> DataArray:
     reduced_list = []
     for _, val in da.groupby(da.time.dt.year):
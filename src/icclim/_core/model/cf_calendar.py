@@ -132,7 +132,7 @@ class CfCalendarRegistry(Registry[CfCalendar]):
         list[str]
             The aliases of the CfCalendar item.
         """
-        return list(map(str.upper, item.aliases))
+        return [alias.upper() for alias in item.aliases]
 
 
 def _proleptic_gregorian_leap(years: DataArray) -> DataArray:
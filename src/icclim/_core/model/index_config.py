@@ -87,6 +87,28 @@ class IndexConfig:
         The reference value for the index calculation.
     """
 
+    __slots__ = (
+        "frequency",
+        "climate_variables",
+        "min_spell_length",
+        "rolling_window_width",
+        "out_unit",
+        "callback",
+        "netcdf_version",
+        "save_thresholds",
+        "interpolation",
+        "is_compared_to_reference",
+        "reference_period",
+        "indicator_name",
+        "logical_link",
+        "coef",
+        "date_event",
+        "sampling_method",
+        "rename",
+        "indicator",
+        "reference",
+    )
+
     frequency: Frequency
     climate_variables: list[ClimateVariable]
     min_spell_length: int | None
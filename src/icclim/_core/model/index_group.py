@@ -55,9 +55,7 @@ class IndexGroup:
         """
         from icclim.ecad.registry import EcadIndexRegistry
 
-        return list(
-            filter(lambda i: i.group in self.values, EcadIndexRegistry.values()),
-        )
+        return [i for i in EcadIndexRegistry.values() if i.group in self.values]
 
     def __or__(self, right: IndexGroup) -> IndexGroup:
         """
@@ -97,7 +97,7 @@ class OperatorRegistry(Registry[Operator]):
         list[str]
             The list of aliases for the operator.
         """
-        return list(map(str.upper, op.aliases))
+        return [alias.upper() for alias in op.aliases]
 
     GREATER = Operator(
         short_name="gt",
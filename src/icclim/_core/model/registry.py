@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from abc import ABC
 from copy import deepcopy
 from typing import Generic, TypeVar
@@ -53,20 +54,34 @@ class Registry(Generic[T], ABC):
         This method performs a case-insensitive lookup.
         It first checks if the query is an instance of the item class, and if so,
         returns a deep copy of the query.
+        The resolution of string queries is cached, see `_find_catalog_key`.
         """
         if isinstance(query, cls._item_class):
             return deepcopy(query)
         if isinstance(query, str):
-            q = query.upper()
-            for key, item in cls.catalog().items():
-                if q == key.upper() or q in cls.get_item_aliases(item):
-                    return deepcopy(item)
+            key = cls._find_catalog_key(query.upper())
+            if key is not None:
+                return deepcopy(cls.__dict__[key])
         msg = (
             f"Unknown {cls._item_class.__qualname__}: '{query}'. "
             f"Use one of {cls.every_aliases()}."
         )
         raise InvalidIcclimArgumentError(msg)
 
+    @classmethod
+    @functools.lru_cache(maxsize=128)
+    def _find_catalog_key(cls, upper_query: str) -> str | None:
+        """
+        Find the catalog key of the item matching `upper_query`.
+
+        Registries are static, thus the results are cached for each registry and
+        query. Only the key is cached, `lookup` still returns a copy of the item.
+        """
+        for key, item in cls.catalog().items():
+            if upper_query == key.upper() or upper_query in cls.get_item_aliases(item):
+                return key
+        return None
+
     @classmethod
     def lookup_no_error(cls, query: T | str) -> T | None:
         """
@@ -100,7 +115,7 @@ class Registry(Generic[T], ABC):
             A list of all aliases for items in the registry.
 
         """
-        return list(map(cls.get_item_aliases, list(cls.catalog().values())))
+        return [cls.get_item_aliases(item) for item in cls.catalog().values()]
 
     @staticmethod
     def get_item_aliases(item: T) -> list[str]:
@@ -12,6 +12,7 @@ indices.
 from __future__ import annotations
 
 import dataclasses
+import functools
 from collections.abc import Hashable
 
 from icclim._core.constants import PART_OF_A_WHOLE_UNIT
@@ -55,6 +56,18 @@ class StandardVariable(Hashable):
             "short_name": self.short_name,
         }
 
+    @functools.cached_property
+    def upper_aliases(self) -> list[str]:
+        """
+        Upper-cased aliases, standard name and long name of the variable.
+
+        Computed once per instance, registry lookups then reuse the cached list.
+        """
+        upper_aliases = [alias.upper() for alias in self.aliases]
+        upper_aliases.append(self.standard_name.upper())
+        upper_aliases.append(self.long_name.upper())
+        return upper_aliases
+
 
 class StandardVariableRegistry(Registry[StandardVariable]):
     """StandardVariableRegistry stores instances of StandardVariable such as PR, TAS."""
@@ -294,7 +307,4 @@ class StandardVariableRegistry(Registry[StandardVariable]):
         list[str]
             A list of aliases for the given StandardVariable.
         """
-        aliases = list(map(str.upper, item.aliases))
-        aliases.append(item.standard_name.upper())
-        aliases.append(item.long_name.upper())
-        return aliases
+        return item.upper_aliases
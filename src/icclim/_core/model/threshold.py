@@ -74,6 +74,8 @@ class Threshold(abc.ABC):
     See :ref:`generic_indices_recipes` for how to use custom thresholds.
     """
 
+    __slots__ = ()
+
     operator: Operator | str
     value: ThresholdValueType
     unit: str | None = None
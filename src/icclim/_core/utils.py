@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import functools
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 import dateparser
+import numpy as np
 
 from icclim.exception import InvalidIcclimArgumentError
 
+if TYPE_CHECKING:
+    import jinja2
+
 
 def read_date(in_date: str | datetime) -> datetime:
     """
@@ -25,7 +31,7 @@ def read_date(in_date: str | datetime) -> datetime:
     """
     if isinstance(in_date, datetime):
         return in_date
-    date = dateparser.parse(in_date)
+    date = _parse_date(in_date)
     if date is None:
         msg = (
             f"The date {in_date} does not have a valid format."
@@ -36,8 +42,39 @@ def read_date(in_date: str | datetime) -> datetime:
     return date
 
 
+def _parse_date(in_date: str) -> datetime | None:
+    try:
+        return _parse_iso_date(in_date)
+    except ValueError:
+        # Relative or partial dates (e.g. "today", "july 2042") depend on the current
+        # date, they must not be cached.
+        return dateparser.parse(in_date)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_iso_date(in_date: str) -> datetime:
+    # The same few dates (e.g. the bounds of the reference period of percentiles)
+    # are parsed again for each index.
+    # Only absolute dates are cached, thus the result does not depend on when
+    # they are parsed.
+    return datetime.fromisoformat(in_date)
+
+
 def is_number_sequence(values: object) -> bool:
     """Return True if values is a sequence of numbers."""
+    # Numpy scalars are accepted, but not array-likes such as 0-d arrays.
     return isinstance(values, (tuple, list)) and all(
-        (isinstance(x, (float, int)) for x in values),
+        isinstance(x, (float, int, np.number)) for x in values
     )
+
+
+@functools.lru_cache(maxsize=256)
+def get_jinja_template(jinja_env: jinja2.Environment, source: str) -> jinja2.Template:
+    """
+    Compile a jinja template, only once per environment and source.
+
+    Metadata templates are the same for every computed index, thus compiling them
+    on each rendering is wasteful. The variables must be given when rendering, with
+    ``get_jinja_template(env, source).render(scope)``.
+    """
+    return jinja_env.from_string(source)
@@ -494,10 +494,10 @@ def _get_end_date(
 
 
 def _get_frequency_from_string(query: str) -> Frequency:
+    upper_query = query.upper()
     for key, freq in FrequencyRegistry.catalog().items():
-        if key == query.upper() or query.upper() in map(
-            str.upper,
-            freq.accepted_values,
+        if key == upper_query or any(
+            upper_query == v.upper() for v in freq.accepted_values
         ):
             return freq
     # else assumes it's a pandas frequency (such as "W" or "3MS")
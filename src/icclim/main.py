@@ -12,6 +12,7 @@ A convenience function `indices` is also exposed to compute multiple indices at
 from __future__ import annotations
 
 import datetime as dt
+import math
 import operator
 import time
 from collections.abc import Sequence
@@ -74,6 +75,12 @@ log: IcclimLogger = IcclimLogger.get_instance(VerbosityRegistry.LOW)
 HISTORY_CF_KEY = "history"
 SOURCE_CF_KEY = "source"
 ICCLIM_REFERENCE = "icclim"
+# HDF5 chunks must be smaller than 4 GiB.
+HDF5_MAX_CHUNK_BYTES = 2**32
+# Encodings describing the layout of the source file, replaced by the dask chunks.
+STALE_LAYOUT_ENCODINGS = frozenset(
+    ("chunksizes", "contiguous", "original_shape", "preferred_chunks"),
+)
 
 
 def indices(
@@ -163,25 +170,24 @@ def _get_ecad_indices_of_group(
         query = [query]
     # -- Look for standard indices (e.g. index_group='tx90p')
     indices = [EcadIndexRegistry.lookup_no_error(i) for i in query]
-    indices = list(filter(lambda x: x is not None, indices))
+    indices = [i for i in indices if i is not None]
     if len(indices) == len(query):
         return indices
     # -- Look for variables in standard indices (e.g. index_group='tasmax')
-    indices = []
-    for ecad_index in EcadIndexRegistry.values():
-        has_var = True
-        for var in ecad_index.input_variables:
-            is_query_in_aliases = (
-                standard_var in var.aliases for standard_var in query
-            )
-            has_var &= any(is_query_in_aliases)
-        if has_var:
-            indices.append(ecad_index)
+    queried_vars = frozenset(q for q in query if isinstance(q, str))
+    indices = [
+        ecad_index
+        for ecad_index in EcadIndexRegistry.values()
+        if all(
+            not queried_vars.isdisjoint(var.aliases)
+            for var in ecad_index.input_variables
+        )
+    ]
     if len(indices) >= len(query):
         return indices
     # -- Look for index group (e.g. index_group='HEAT')
     groups = [IndexGroupRegistry.lookup_no_error(i) for i in query]
-    groups = list(filter(lambda x: x is not None, groups))
+    groups = [g for g in groups if g is not None]
     indices = (x.get_indices() for x in groups)
     indices = reduce(operator.add, indices, [])  # flatten list[list]
     if len(indices) >= len(query):
@@ -731,13 +737,44 @@ def _write_output_file(
         }
     else:
         time_encoding = {UNITS_KEY: "days since 1850-1-1"}
+    encoding = _get_chunks_encoding(result_ds, netcdf_version)
+    encoding["time"] = time_encoding
     result_ds.to_netcdf(
         file_path,
         format=netcdf_version.name,
-        encoding={"time": time_encoding},
+        encoding=encoding,
     )
 
 
+def _get_chunks_encoding(
+    result_ds: xr.Dataset,
+    netcdf_version: NetcdfVersion,
+) -> dict[str, dict]:
+    """
+    Align the netCDF chunks of the written variables on their dask chunks.
+
+    Without explicit ``chunksizes``, the variables are written contiguously and
+    reopening the file with dask leads to needlessly large task graphs.
+    Only netCDF4 formats support chunking.
+    The given encoding replaces the variable ``encoding`` when writing, thus the
+    other encodings of the variable (e.g. dtype, compression) are kept.
+    """
+    if not netcdf_version.name.startswith("NETCDF4"):
+        return {}
+    encoding = {}
+    for name, da in result_ds.data_vars.items():
+        if not da.chunks or da.dtype.kind not in "biuf":
+            continue
+        chunksizes = tuple(c[0] for c in da.chunks)
+        chunk_bytes = math.prod(chunksizes) * da.dtype.itemsize
+        if all(chunksizes) and chunk_bytes < HDF5_MAX_CHUNK_BYTES:
+            encoding[name] = {
+                k: v for k, v in da.encoding.items() if k not in STALE_LAYOUT_ENCODINGS
+            }
+            encoding[name]["chunksizes"] = chunksizes
+    return encoding
+
+
 def _handle_deprecated_params(
     index_name: str | GenericIndicator | StandardIndex | None,
     user_index: UserIndexDict | None,
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import re
+import functools
 from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
@@ -37,8 +37,7 @@ from icclim.exception import InvalidIcclimArgumentError
 if TYPE_CHECKING:
     import pint
 
-VALUE_REGEX = re.compile(r"-?\d+\.?\d*")
-OPERAND_REGEX = re.compile(r"[<>=]")
+OPERAND_CHARS = frozenset("<>=")
 
 
 def build_threshold(
@@ -179,21 +178,45 @@ def build_threshold(
 
 
 def _get_operator(query: str) -> tuple[Operator | None, str]:
-    operand = "".join(OPERAND_REGEX.findall(query))
-    op = OperatorRegistry.lookup_no_error(operand)
+    start = 0
+    while start < len(query) and query[start].isspace():
+        start += 1
+    end = start
+    while end < len(query) and query[end] in OPERAND_CHARS:
+        end += 1
+    op = OperatorRegistry.lookup_no_error(query[start:end])
     if op is not None:
-        return op, query.replace(op.operand, "", 1)
+        return op, query[end:]
     return None, query
 
 
+def _get_first_number(query: str) -> str | None:
+    """Return the first number found in ``query``, such as "-1.5" in "a-1.5b"."""
+    size = len(query)
+    for start, char in enumerate(query):
+        if char.isdigit():
+            break
+        if char == "-" and start + 1 < size and query[start + 1].isdigit():
+            break
+    else:
+        return None
+    end = start + 1
+    while end < size and query[end].isdigit():
+        end += 1
+    if end < size and query[end] == ".":
+        end += 1
+        while end < size and query[end].isdigit():
+            end += 1
+    return query[start:end]
+
+
+@functools.lru_cache(maxsize=256)
 def _read_string_threshold(query: str) -> tuple[str, str, float]:
     op, no_op_query = _get_operator(query)
     operand = op.operand if op else ""
     if DOY_PERCENTILE_UNIT in no_op_query:
-        val = re.findall(VALUE_REGEX, no_op_query)[0]
         unit = DOY_PERCENTILE_UNIT
     elif PERIOD_PERCENTILE_UNIT in no_op_query:
-        val = re.findall(VALUE_REGEX, no_op_query)[0]
         unit = PERIOD_PERCENTILE_UNIT
     else:
         try:
@@ -201,8 +224,12 @@ def _read_string_threshold(query: str) -> tuple[str, str, float]:
         except UndefinedUnitError as e:
             msg = f"Could not build threshold from {query}"
             raise InvalidIcclimArgumentError(msg) from e
-        val = quantity.m
         unit = None if quantity.unitless else str(quantity.units)
+        return operand, unit, quantity.m
+    val = _get_first_number(no_op_query)
+    if val is None:
+        msg = f"Could not find a percentile value in {query}"
+        raise InvalidIcclimArgumentError(msg)
     return operand, unit, val
 
 
@@ -251,8 +278,7 @@ def _read_input(
     if _must_read_bounded(operator, value, unit, thresholds, logical_link):
         return _read_bounded_threshold(thresholds, logical_link)
     if operator is not None:
-        if (operator := OperatorRegistry.lookup_no_error(operator)) is None:
-            operator = OperatorRegistry.REACH
+        operator = _lookup_operator(operator)
         return {
             "operator": operator,
             "unit": unit,
@@ -265,6 +291,12 @@ def _read_input(
     raise NotImplementedError(msg)
 
 
+def _lookup_operator(operator: Operator | str) -> Operator:
+    if (op := OperatorRegistry.lookup_no_error(operator)) is None:
+        return OperatorRegistry.REACH
+    return op
+
+
 def _read_bounded_threshold(
     thresholds: tuple[Threshold, Threshold],
     logical_link: LogicalLink | str,
@@ -296,8 +328,7 @@ def _read_threshold_from_query(
     kwargs: dict,
 ) -> ThresholdBuilderInput:
     operator, unit, value = _read_string_threshold(query)
-    if (operator := OperatorRegistry.lookup_no_error(operator)) is None:
-        operator = OperatorRegistry.REACH
+    operator = _lookup_operator(operator)
     return {
         "operator": operator,
         "unit": unit,
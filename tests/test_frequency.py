@@ -87,9 +87,25 @@ class TestBuildFrequencyOverList:
 
 
 class TestSeasonsResampler:
-    def test_simple(self) -> None:
+    # The seasonal time updater rewrites the time axis in place, thus tests must work
+    # on copies of these class scoped fixtures.
+    @pytest.fixture(scope="class")
+    def amj_tas(self):
+        return filter_months(stub_tas(), [4, 5, 6]).resample(time="YS").mean().load()
+
+    @pytest.fixture(scope="class")
+    def ndj_tas(self):
+        return {
+            use_cf: filter_months(stub_tas(use_cftime=use_cf), [11, 12, 1])
+            .resample(time="YS-NOV")
+            .mean()
+            .load()
+            for use_cf in (True, False)
+        }
+
+    def test_simple(self, amj_tas) -> None:
         # WHEN
-        test_da = filter_months(stub_tas(), [4, 5, 6]).resample(time="YS").mean()
+        test_da = amj_tas.copy()
         da_res, time_bds_res = get_seasonal_time_updater(4, 6)(test_da)
         # THEN
         np.testing.assert_array_equal(1, da_res)
@@ -99,9 +115,9 @@ class TestSeasonsResampler:
             == pd.to_datetime("2042-07") - pd.tseries.offsets.Day()
         )
 
-    def test_winter(self) -> None:
+    def test_winter(self, ndj_tas) -> None:
         # WHEN
-        test_da = filter_months(stub_tas(), [11, 12, 1]).resample(time="YS-NOV").mean()
+        test_da = ndj_tas[False].copy()
         da_res, time_bds_res = get_seasonal_time_updater(11, 1)(test_da)
         # THEN
         np.testing.assert_array_equal(1, da_res)
@@ -117,13 +133,9 @@ class TestSeasonsResampler:
         )
 
     @pytest.mark.parametrize("use_cf", [True, False])
-    def test_between_dates(self, use_cf) -> None:
+    def test_between_dates(self, use_cf, ndj_tas) -> None:
         # WHEN
-        test_da = (
-            filter_months(stub_tas(use_cftime=use_cf), [11, 12, 1])
-            .resample(time="YS-NOV")
-            .mean()
-        )
+        test_da = ndj_tas[use_cf].copy()
         da_res, time_bds_res = get_seasonal_time_updater(11, 1, 2, 30)(test_da)
         # THEN
         np.testing.assert_array_equal(1, da_res)  # data must be unchanged
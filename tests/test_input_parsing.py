@@ -11,10 +11,12 @@ import xarray as xr
 from icclim._core.constants import UNITS_KEY
 from icclim._core.input_parsing import (
     PercentileDataArray,
+    guess_standard_variable,
     guess_var_names,
     read_dataset,
     update_to_standard_coords,
 )
+from icclim._core.model.standard_variable import StandardVariableRegistry
 from icclim.ecad.registry import EcadIndexRegistry
 from icclim.exception import InvalidIcclimArgumentError
 
@@ -42,6 +44,20 @@ def test_update_to_standard_coords() -> None:
     assert "time" in res.coords
 
 
+def test_guess_standard_variable__from_standard_name_attr() -> None:
+    da = xr.DataArray(
+        data=np.full(10, 42),
+        name="pouet",
+        attrs={"standard_name": "average_air_temperature"},
+    )
+    assert guess_standard_variable(da) == StandardVariableRegistry.TAS
+
+
+def test_guess_standard_variable__unknown() -> None:
+    da = xr.DataArray(data=np.full(10, 42), name="pouet")
+    assert guess_standard_variable(da) is None
+
+
 class TestReadDataset:
     OUTPUT_NC_FILE = Path("tmp.nc")
     OUTPUT_NC_FILE_2 = Path("tmp-2.nc")
@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-import contextlib
 import datetime as dt
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import cftime
@@ -15,9 +13,11 @@ import xarray as xr
 from icclim import __version__ as icclim_version
 from icclim._core.constants import PART_OF_A_WHOLE_UNIT, REFERENCE_PERIOD_ID, UNITS_KEY
 from icclim._core.model.index_group import IndexGroupRegistry
+from icclim._core.model.netcdf_version import NetcdfVersionRegistry
 from icclim.ecad.registry import EcadIndexRegistry
 from icclim.exception import InvalidIcclimArgumentError
 from icclim.frequency import FrequencyRegistry
+from icclim.main import _get_chunks_encoding
 from icclim.threshold.factory import build_threshold
 
 from tests.testing_utils import K2C, stub_pr, stub_tas
@@ -35,6 +35,28 @@ def test_deprecated_indice(log_mock: MagicMock, index_mock: MagicMock) -> None:
     index_mock.assert_called_once()
 
 
+def test_get_chunks_encoding__keeps_other_encodings() -> None:
+    da = xr.DataArray(np.zeros((4, 2)), dims=["time", "lat"], name="thresh")
+    da = da.chunk({"time": 2})
+    da.encoding = {
+        "dtype": "float32",
+        "zlib": True,
+        "_FillValue": 1e20,
+        "chunksizes": (4, 2),
+        "contiguous": False,
+        "original_shape": (4, 2),
+    }
+    res = _get_chunks_encoding(da.to_dataset(), NetcdfVersionRegistry.NETCDF4)
+    assert res == {
+        "thresh": {
+            "dtype": "float32",
+            "zlib": True,
+            "_FillValue": 1e20,
+            "chunksizes": (2, 2),
+        },
+    }
+
+
 HEAT_INDICES = ["SU", "TR", "WSDI", "TG90p", "TN90p", "TX90p", "TXx", "TNx", "CSU"]
 
 
@@ -46,12 +68,10 @@ class TestIntegration:
     `test_ecad_indices.py` as well as in xclim directly.
     The goal is to make sure the whole app can run smoothly.
 
-    These tests have side effect:
-    - writing and removing of "out.nc" file
-
+    Only a few tests write their results to a netCDF file, in a temporary
+    directory shared by the class.
     """
 
-    OUTPUT_FILE = Path("out.nc")
     TIME_RANGE = pd.date_range(start="2042-01-01", end="2045-12-31", freq="D")
     CF_TIME_RANGE = xr.cftime_range("2042-01-01", end="2045-12-31", freq="D")
     data = xr.DataArray(
@@ -102,44 +122,51 @@ class TestIntegration:
         filter(lambda x: "spi" not in x.short_name.lower(), EcadIndexRegistry.values()),
     )
 
-    @pytest.fixture(autouse=True)
-    def _cleanup(self):
-        # setup
-        # ...
-        yield
-        # teardown
-        with contextlib.suppress(FileNotFoundError):
-            self.OUTPUT_FILE.unlink()
+    @pytest.fixture(scope="class")
+    def output_file(self, tmp_path_factory):
+        # Shared by the few tests checking the results can be written to netCDF.
+        # The others work on the in-memory results.
+        return tmp_path_factory.mktemp("integration") / "out.nc"
 
-    def test_index_su(self) -> None:
+    def test_index_su(self, output_file) -> None:
         tas = stub_tas(tas_value=26 + K2C)
         tas[:5] = 0
         res = icclim.index(
             index_name="SU",
             in_files=tas,
-            out_file=self.OUTPUT_FILE,
+            out_file=output_file,
             slice_mode="ms",
         )
         assert f"icclim version: {icclim_version}" in res.attrs["history"]
         assert res.SU.isel(time=0) == 26  # January
 
-    def test_index_su__on_dataset(self) -> None:
+    def test_index_su__on_dataset(self, output_file) -> None:
         res = icclim.index(
             index_name="SU",
             var_name="data",
             in_files=self.dataset_with_time_bounds,
-            out_file=self.OUTPUT_FILE,
+            out_file=output_file,
         )
         assert f"icclim version: {icclim_version}" in res.attrs["history"]
         np.testing.assert_array_equal(0, res.SU)
 
+    def test_index_su__netcdf_chunks_aligned_on_dask_chunks(self, output_file) -> None:
+        icclim.index(
+            index_name="SU",
+            in_files=self.data,
+            out_file=output_file,
+            slice_mode="ms",
+        )
+        with xr.open_dataset(output_file) as written:
+            # 4 years of daily data fit in a single dask chunk, hence 48 months.
+            assert written.SU.encoding["chunksizes"] == (48, 1, 1)
+
     def test_index_dtr(self) -> None:
         ds = self.data.to_dataset(name="toto")
         ds["tutu"] = self.data + 10
         res = icclim.index(
             index_name="DTR",
             in_files=ds,
-            out_file=self.OUTPUT_FILE,
             var_name=["toto", "tutu"],
         )
         assert f"icclim version: {icclim_version}" in res.attrs["history"]
@@ -152,7 +179,6 @@ class TestIntegration:
         ds["tutu"].attrs["units"] = "K"
         res = icclim.dtr(
             in_files=ds,
-            out_file=self.OUTPUT_FILE,
             var_name=["toto", "tutu"],
         )
         assert f"icclim version: {icclim_version}" in res.attrs["history"]
@@ -166,7 +192,6 @@ class TestIntegration:
         res = icclim.index(
             index_name="CD",
             in_files=ds,
-            out_file=self.OUTPUT_FILE,
         )
         assert f"icclim version: {icclim_version}" in res.attrs["history"]
         np.testing.assert_array_equal(0, res.CD)
@@ -181,13 +206,11 @@ class TestIntegration:
         res_string_dates = icclim.index(
             index_name="SU",
             in_files=self.data,
-            out_file=self.OUTPUT_FILE,
             time_range=("19 july 2042", "14 august 2044"),
         )
         res_datetime_dates = icclim.index(
             index_name="SU",
             in_files=self.data,
-            out_file=self.OUTPUT_FILE,
             time_range=[
                 dt.datetime(2042, 7, 19, tzinfo=dt.timezone.utc),
                 dt.datetime(2044, 8, 14, tzinfo=dt.timezone.utc),
@@ -211,7 +234,6 @@ class TestIntegration:
         res = icclim.index(
             index_name="SU",
             in_files=self.data,
-            out_file=self.OUTPUT_FILE,
             slice_mode="2W-WED",
         )
         # THEN
@@ -235,7 +257,6 @@ class TestIntegration:
         res = icclim.index(
             index_name="SU",
             in_files=self.data,
-            out_file=self.OUTPUT_FILE,
             slice_mode=FrequencyRegistry.MONTH,
         )
         np.testing.assert_array_equal(0, res.SU)
@@ -244,11 +265,11 @@ class TestIntegration:
             len(res.time),
         )
 
-    def test_index_su__monthy_sampled_cf_time(self) -> None:
+    def test_index_su__monthy_sampled_cf_time(self, output_file) -> None:
         res = icclim.index(
             index_name="SU",
             in_files=self.data_cf_time,
-            out_file=self.OUTPUT_FILE,
+            out_file=output_file,
             slice_mode=FrequencyRegistry.MONTH,
         )
         np.testing.assert_array_equal(0, res.SU)
@@ -275,11 +296,11 @@ class TestIntegration:
             0,
         )
 
-    def test_index_su__djf_cf_time(self) -> None:
+    def test_index_su__djf_cf_time(self, output_file) -> None:
         res = icclim.index(
             index_name="SU",
             in_files=self.data_cf_time,
-            out_file=self.OUTPUT_FILE,
+            out_file=output_file,
             slice_mode=FrequencyRegistry.DJF,
         )
         np.testing.assert_array_equal(res.SU.isel(time=0), np.NAN)
@@ -312,7 +333,6 @@ class TestIntegration:
         res = icclim.indices(
             index_group=IndexGroupRegistry.HEAT,
             in_files=self.data,
-            out_file=self.OUTPUT_FILE,
         )
         for i in HEAT_INDICES:
             assert res[i] is not None
@@ -321,7 +341,6 @@ class TestIntegration:
         res = icclim.indices(
             index_group="tasmax",
             in_files=self.data,
-            out_file=self.OUTPUT_FILE,
         )
         for i in ["SU", "WSDI", "TX90p", "TXx", "CSU", "ID", "TX10p", "TXn"]:
             assert res[i] is not None
@@ -330,7 +349,6 @@ class TestIntegration:
         res = icclim.indices(
             index_group="tx90p",
             in_files=self.data,
-            out_file=self.OUTPUT_FILE,
         )
         for i in ["TX90p"]:
             assert res[i] is not None
@@ -342,7 +360,6 @@ class TestIntegration:
         res = icclim.indices(
             index_group=["tas", "pr"],
             in_files=ds,
-            out_file=self.OUTPUT_FILE,
             base_period_time_range=("2042-01-01", "2042-12-31"),
         )
         for i in [
@@ -382,7 +399,6 @@ class TestIntegration:
         res = icclim.indices(
             index_group=IndexGroupRegistry.HEAT | IndexGroupRegistry.SNOW,
             in_files=ds,
-            out_file=self.OUTPUT_FILE,
         )
         for i in [
             "SU",
@@ -407,7 +423,6 @@ class TestIntegration:
             icclim.indices(
                 index_group="wubaluba dub dub",
                 in_files=ds,
-                out_file=self.OUTPUT_FILE,
             )
 
     def test_indices__snow_indices(self) -> None:
@@ -417,7 +432,6 @@ class TestIntegration:
         res = icclim.indices(
             index_group=IndexGroupRegistry.SNOW,
             in_files=ds,
-            out_file=self.OUTPUT_FILE,
         )
         for i in filter(
             lambda i: i.group == IndexGroupRegistry.SNOW,
@@ -425,11 +439,11 @@ class TestIntegration:
         ):
             assert res[i.short_name] is not None
 
-    def test_indices_all_from_dataset(self) -> None:
+    def test_indices_all_from_dataset(self, output_file) -> None:
         res = icclim.indices(
             index_group="all",
             in_files=self.full_data,
-            out_file=self.OUTPUT_FILE,
+            out_file=output_file,
             base_period_time_range=("2042-01-01", "2042-12-31"),
         )
         for i in EcadIndexRegistry.values():
@@ -440,7 +454,6 @@ class TestIntegration:
             icclim.indices(
                 index_group="SPI3",
                 in_files=self.full_data,
-                out_file=self.OUTPUT_FILE,
                 slice_mode=["season", [1, 2, 3]],
                 base_period_time_range=("2042-01-01", "2042-12-31"),
             )
@@ -458,7 +471,6 @@ class TestIntegration:
         res = icclim.indices(
             index_group="all",
             in_files=self.full_data,
-            out_file=self.OUTPUT_FILE,
             slice_mode=["season", [1, 2, 3]],
             ignore_error=True,
         )
@@ -469,7 +481,6 @@ class TestIntegration:
         res = icclim.indices(
             index_group="all",
             in_files=self.full_data,
-            out_file=self.OUTPUT_FILE,
             slice_mode=["season", ["07-19", "08-14"]],
             ignore_error=True,
         )
@@ -480,7 +491,6 @@ class TestIntegration:
         res = icclim.indices(
             index_group="all",
             in_files=self.full_data,
-            out_file=self.OUTPUT_FILE,
             slice_mode=["season", [1, 2, 3]],
             ignore_error=True,
         )
@@ -491,7 +501,6 @@ class TestIntegration:
         res = icclim.indices(
             index_group="all",
             in_files=self.full_data,
-            out_file=self.OUTPUT_FILE,
             slice_mode=["season", [12, 1, 2, 3]],
             ignore_error=True,
         )
@@ -504,7 +513,6 @@ class TestIntegration:
         res: xr.Dataset = icclim.indices(
             index_group="all",
             in_files=no_snow,
-            out_file=self.OUTPUT_FILE,
             ignore_error=True,
             slice_mode="DJF",
             base_period_time_range=("2042-01-01", "2042-12-31"),
@@ -529,7 +537,6 @@ class TestIntegration:
             icclim.indices(
                 index_group="all",
                 in_files=ds,
-                out_file=self.OUTPUT_FILE,
                 ignore_error=False,
             )
 
@@ -539,7 +546,6 @@ class TestIntegration:
         res = icclim.index(
             index_name="TR",
             in_files=tas,
-            out_file=self.OUTPUT_FILE,
             slice_mode="ms",
         )
         assert f"icclim version: {icclim_version}" in res.attrs["history"]
@@ -551,12 +557,11 @@ class TestIntegration:
         pr[:10] = 0
         res = icclim.prcptot(
             in_files=pr,
-            out_file=self.OUTPUT_FILE,
             slice_mode="MS",
         ).load()
         np.testing.assert_array_almost_equal(res.PRCPTOT.isel(time=0), 42)
 
-    def test_index_r75ptot(self) -> None:
+    def test_index_r75ptot(self, output_file) -> None:
         # 2.32e-06 is about 0.2 mm/day
         # they will be ignore in computation because < 1 mm/day
         pr = stub_pr(value=2e-06)
@@ -565,7 +570,7 @@ class TestIntegration:
         pr[10:110] = 2e-05  # 100 days of ~2 mm/day
         res = icclim.r75ptot(
             in_files=pr,
-            out_file=self.OUTPUT_FILE,
+            out_file=output_file,
             slice_mode="year",
             save_thresholds=True,
         ).load()
@@ -579,7 +584,6 @@ class TestIntegration:
         res = icclim.index(
             index_name="csu",
             in_files=tas,
-            out_file=self.OUTPUT_FILE,
             slice_mode="ms",
         ).load()
         # in January there are only 10 days above 25degC
@@ -595,7 +599,6 @@ class TestIntegration:
         res = icclim.index(
             index_name="gd4",
             in_files=tas,
-            out_file=self.OUTPUT_FILE,
             slice_mode="ms",
         )
         expected = (26 - 4) * 21
@@ -608,7 +611,6 @@ class TestIntegration:
         tas[5:15] = 270  # ~ -3degC
         res = icclim.cfd(
             in_files=tas,
-            out_file=self.OUTPUT_FILE,
             slice_mode="ms",
         ).load()
         # 10 days in January that are below or equal to 0degC
@@ -621,7 +623,6 @@ class TestIntegration:
         res = icclim.index(
             index_name="fd",
             in_files=tas,
-            out_file=self.OUTPUT_FILE,
             slice_mode="ms",
         )
         assert res.FD.isel(time=0) == 15
@@ -632,7 +633,6 @@ class TestIntegration:
         res = icclim.index(
             index_name="hd17",
             in_files=tas,
-            out_file=self.OUTPUT_FILE,
             slice_mode="ms",
         )
         assert res.HD17.isel(time=0) == 5 * (17 + K2C)
@@ -646,7 +646,6 @@ class TestIntegration:
             doy_window_width=5,
             base_period_time_range=("2042-01-01", "2042-12-31"),
             time_range=("2042-01-01", "2045-12-31"),
-            out_file=self.OUTPUT_FILE,
             slice_mode="ms",
         )
         assert REFERENCE_PERIOD_ID not in res.TX90p.attrs
@@ -664,7 +663,6 @@ class TestIntegration:
             doy_window_width=1,
             time_range=("2043-01-01", "2045-12-31"),
             base_period_time_range=("2042-01-01", "2042-12-31"),
-            out_file=self.OUTPUT_FILE,
             slice_mode="ms",
         )
         assert REFERENCE_PERIOD_ID not in res.TX90p.attrs
@@ -680,7 +678,6 @@ class TestIntegration:
             doy_window_width=1,
             time_range=("2042-01-01", "2045-12-31"),
             base_period_time_range=("2042-01-01", "2043-12-31"),
-            out_file=self.OUTPUT_FILE,
             slice_mode="ms",
         )
         assert REFERENCE_PERIOD_ID in res.TX90p.attrs
@@ -698,7 +695,6 @@ class TestIntegration:
             doy_window_width=1,
             time_range=("2043-01-01", "2045-12-31"),
             base_period_time_range=("2042-01-01", "2042-12-31"),
-            out_file=self.OUTPUT_FILE,
             slice_mode="ms",
         )
         assert REFERENCE_PERIOD_ID not in res.WSDI.attrs
@@ -714,7 +710,6 @@ class TestIntegration:
             doy_window_width=1,
             time_range=("2043-01-01", "2045-12-31"),
             base_period_time_range=("2042-01-01", "2042-12-31"),
-            out_file=self.OUTPUT_FILE,
             slice_mode="ms",
         )
         assert REFERENCE_PERIOD_ID not in res.CSDI.attrs
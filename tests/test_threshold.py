@@ -40,6 +40,54 @@ def test_build_threshold__from_query() -> None:
     assert res.unit == "°C"
 
 
+def test_build_threshold__from_query_with_operator_alias() -> None:
+    res = build_threshold(" => -10.5 degC")
+    assert res.operator == OperatorRegistry.GREATER_OR_EQUAL
+    assert res.value == -10.5
+    assert res.unit == "°C"
+
+
+def test_build_threshold__same_value_are_independent() -> None:
+    first = build_threshold(operator=">", value=10)
+    first.unit = "degC"
+    second = build_threshold(operator=">", value=10)
+    assert first.unit == "degC"
+    assert second.unit is None
+    assert second.value.attrs[UNITS_KEY] is None
+
+
+def test_build_threshold__same_value_are_independent__values() -> None:
+    first = build_threshold(operator=">", value=[10, 20], unit="degC")
+    first.value.values[0] = 15
+    second = build_threshold(operator=">", value=[10, 20], unit="degC")
+    np.testing.assert_array_equal(second.value, [10, 20])
+
+
+def test_build_basic_threshold__from_numpy_scalars() -> None:
+    res = build_threshold(
+        operator=">",
+        value=[np.float32(10), np.float32(20)],
+        unit="degC",
+    )
+    assert isinstance(res, BasicThreshold)
+    np.testing.assert_array_equal(res.value, [10, 20])
+    assert res.value.dims == ("threshold",)
+
+
+def test_build_basic_threshold__from_array_likes_error() -> None:
+    with pytest.raises(NotImplementedError):
+        build_threshold(
+            operator=">",
+            value=[np.array(10.0), np.array(20.0)],
+            unit="degC",
+        )
+
+
+def test_build_per_threshold__from_query_without_value() -> None:
+    with pytest.raises(InvalidIcclimArgumentError):
+        build_threshold("> doy_per")
+
+
 def test_build_bounded_threshold__from_query() -> None:
     res = build_threshold(">10degC and <20degC")
     assert isinstance(res, BoundedThreshold)
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from datetime import datetime
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from icclim._core.utils import _parse_iso_date, is_number_sequence, read_date
+from icclim.exception import InvalidIcclimArgumentError
+
+A_DATE = datetime(2042, 2, 3)  # noqa: DTZ001
+
+
+def test_read_date__iso_date_is_not_parsed_by_dateparser() -> None:
+    with patch("icclim._core.utils.dateparser.parse") as parse:
+        assert read_date("2042-02-03") == A_DATE
+    parse.assert_not_called()
+
+
+def test_read_date__iso_date_is_cached() -> None:
+    _parse_iso_date.cache_clear()
+    assert read_date("2042-02-03") == A_DATE
+    assert _parse_iso_date.cache_info().hits == 0
+    assert read_date("2042-02-03") == A_DATE
+    assert _parse_iso_date.cache_info().hits == 1
+
+
+def test_read_date__relative_date_is_parsed_each_time() -> None:
+    with patch("icclim._core.utils.dateparser.parse", return_value=A_DATE) as parse:
+        assert read_date("2 years ago") == A_DATE
+        assert read_date("2 years ago") == A_DATE
+    assert parse.call_count == 2
+
+
+def test_read_date__error() -> None:
+    with pytest.raises(InvalidIcclimArgumentError):
+        read_date("Coco l'asticot")
+
+
+def test_is_number_sequence() -> None:
+    assert is_number_sequence([1, 2.5, np.float32(3)])
+    assert not is_number_sequence([np.array(1.0), np.array(2.0)])
+    assert not is_number_sequence([1, "2"])
+    assert not is_number_sequence(1)